@@ -1,120 +1,218 @@
 """Watchlist — Flask backend and REST API."""
 
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 
+import fastjsonschema
+import orjson
 from bson import ObjectId
-from flask import Flask, jsonify, request, send_from_directory
+from fastjsonschema import JsonSchemaException
+from flask import Flask, abort, jsonify, request
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 
-from config import get_items_collection
+from config import TIMEZONE, ensure_indexes, get_items_collection
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson; serializes datetime to ISO 8601 natively."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-app = Flask(__name__, static_folder=None)
 
 # Project root for serving frontend files
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 
+class WatchlistFlask(Flask):
+    """Flask app whose unversioned frontend files always revalidate."""
+
+    # Pages and the assets they load by fixed URL change on every deploy
+    REVALIDATE_SUFFIXES = (".html", ".js", ".css")
+
+    def get_send_file_max_age(self, filename):
+        if filename and filename.endswith(self.REVALIDATE_SUFFIXES):
+            return None  # no max-age: browsers revalidate with the ETag
+        return super().get_send_file_max_age(filename)
+
+
+# Frontend files go through Flask's static view (conditional GET, ETag, sendfile)
+app = WatchlistFlask(__name__, static_folder=str(FRONTEND_DIR), static_url_path="")
+app.json = ORJSONProvider(app)
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+# Let a reverse proxy that supports X-Sendfile stream static files itself
+app.use_x_sendfile = os.getenv("USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
+
+# Items are tiny; reject oversized bodies before reading or parsing them
+MAX_BODY_BYTES = 64 * 1024
+app.config["MAX_CONTENT_LENGTH"] = MAX_BODY_BYTES
+
+# gzip/br-encode JSON responses only: compressing static files would buffer
+# them in Python and bypass sendfile / X-Sendfile
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+Compress(app)
+
 # Allowed fields for watchlist items
-ITEM_FIELDS = {
-    "title",
-    "type",
-    "status",
-    "rating",
-    "current_episode",
-    "total_episodes",
-    "notes",
-    "date_added",
-}
-REQUIRED_FIELDS = {"title"}
-VALID_TYPES = {"Movie", "TV Show"}
-VALID_STATUSES = {"Planned", "Watching", "Completed", "Dropped"}
+ITEM_FIELDS = frozenset(
+    {
+        "title",
+        "type",
+        "status",
+        "rating",
+        "current_episode",
+        "total_episodes",
+        "notes",
+        "date_added",
+    }
+)
+REQUIRED_FIELDS = frozenset({"title"})
+VALID_TYPES = frozenset({"Movie", "TV Show"})
+VALID_STATUSES = frozenset({"Planned", "Watching", "Completed", "Dropped"})
 RATING_MIN, RATING_MAX = 1, 10
+_INT_FIELDS = frozenset({"rating", "current_episode", "total_episodes"})
+
+# 24 hex digits: the only string form ObjectId() accepts for item ids
+_OID_RE = re.compile(r"\A[0-9a-fA-F]{24}\Z")
+
+# Only fetch the fields the API returns; fetch the whole list in one batch
+ITEM_PROJECTION = {f: 1 for f in ITEM_FIELDS} | {"_id": 1}
+LIST_BATCH_SIZE = 1000
 
 
 def serialize_item(doc):
-    """Convert MongoDB document to JSON-serializable dict (ObjectId -> str)."""
+    """Convert MongoDB document in place to a JSON-serializable dict (ObjectId -> str)."""
     if not doc:
         return None
-    out = dict(doc)
-    out["id"] = str(doc["_id"])
-    del out["_id"]
-    if "date_added" in out and hasattr(out["date_added"], "isoformat"):
-        out["date_added"] = out["date_added"].isoformat()
-    return out
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+# Per-field JSON Schema; optional fields may be sent as null
+_FIELD_SCHEMAS = {
+    "title": {"type": "string", "pattern": r"\S"},
+    "type": {"enum": [*sorted(VALID_TYPES), None]},
+    "status": {"enum": [*sorted(VALID_STATUSES), None]},
+    "rating": {
+        "type": ["integer", "null"],
+        "minimum": RATING_MIN,
+        "maximum": RATING_MAX,
+    },
+    "current_episode": {"type": ["integer", "null"], "minimum": 0},
+    "total_episodes": {"type": ["integer", "null"], "minimum": 0},
+    "notes": {"type": ["string", "null"]},
+    "date_added": {},
+}
+# ITEM_FIELDS also drives ITEM_PROJECTION; fail at import if the two lists drift
+if _FIELD_SCHEMAS.keys() != ITEM_FIELDS:
+    raise RuntimeError("_FIELD_SCHEMAS and ITEM_FIELDS list different fields")
+
+
+def _item_schema(required):
+    """JSON Schema for an item payload, with properties keyed off ITEM_FIELDS."""
+    return {
+        "type": "object",
+        "required": sorted(required),
+        "additionalProperties": False,
+        "properties": {field: _FIELD_SCHEMAS[field] for field in sorted(ITEM_FIELDS)},
+    }
+
+
+_VALIDATE = fastjsonschema.compile(_item_schema(REQUIRED_FIELDS))
+_VALIDATE_UPDATE = fastjsonschema.compile(_item_schema(()))
+
+
+def _schema_error_message(e, data):
+    """Turn a schema failure into the field-level message the API has always returned."""
+    field = e.name.partition(".")[2]
+    if not field:
+        if e.rule == "required":
+            return f"Missing required field: {min(REQUIRED_FIELDS - data.keys())}"
+        if e.rule == "additionalProperties":
+            return f"Unknown field: {min(data.keys() - ITEM_FIELDS)}"
+        return "Request body must be JSON object"
+    if field == "title":
+        return "title is required and cannot be empty"
+    if field == "type":
+        return f"type must be one of: {', '.join(sorted(VALID_TYPES))}"
+    if field == "status":
+        return f"status must be one of: {', '.join(sorted(VALID_STATUSES))}"
+    if field == "rating":
+        if e.rule == "type":
+            return "rating must be an integer"
+        return f"rating must be between {RATING_MIN} and {RATING_MAX}"
+    if field in _INT_FIELDS:
+        if e.rule == "type":
+            return f"{field} must be a number"
+        return f"{field} must be non-negative"
+    if field == "notes":
+        return "notes must be a string"
+    return e.message.removeprefix("data.")
 
 
 def validate_item(data, for_update=False):
-    """Validate item payload. Returns (None, None) if valid, else (error_message, 400)."""
-    if not isinstance(data, dict):
-        return "Request body must be JSON object", 400
-
-    # Required fields
-    if not for_update:
-        for field in REQUIRED_FIELDS:
-            if field not in data or data[field] is None:
-                return f"Missing required field: {field}", 400
-    if "title" in data and (data["title"] is None or str(data["title"]).strip() == ""):
-        return "title is required and cannot be empty", 400
-
-    # Restrict to allowed fields
-    for key in data:
-        if key not in ITEM_FIELDS:
-            return f"Unknown field: {key}", 400
-
-    if "type" in data and data["type"] is not None and data["type"] not in VALID_TYPES:
-        return f"type must be one of: {', '.join(VALID_TYPES)}", 400
-    if (
-        "status" in data
-        and data["status"] is not None
-        and data["status"] not in VALID_STATUSES
-    ):
-        return f"status must be one of: {', '.join(VALID_STATUSES)}", 400
-
-    rating = data.get("rating")
-    if rating is not None:
-        try:
-            r = int(rating)
-            if r < RATING_MIN or r > RATING_MAX:
-                return f"rating must be between {RATING_MIN} and {RATING_MAX}", 400
-        except (TypeError, ValueError):
-            return "rating must be an integer", 400
-
-    for ep in ("current_episode", "total_episodes"):
-        if ep in data and data[ep] is not None:
-            try:
-                if int(data[ep]) < 0:
-                    return f"{ep} must be non-negative", 400
-            except (TypeError, ValueError):
-                return f"{ep} must be a number", 400
-
-    return None, None
-
-
-def build_item_from_body(data):
-    """Build a document for insert/update from request body."""
-    doc = {k: v for k, v in data.items() if k in ITEM_FIELDS and v is not None}
-    if "title" in doc:
-        doc["title"] = str(doc["title"]).strip()
-    if "rating" in doc:
-        doc["rating"] = int(doc["rating"])
-    for ep in ("current_episode", "total_episodes"):
-        if ep in doc:
-            doc[ep] = int(doc[ep])
-    if "notes" in doc:
-        doc["notes"] = str(doc["notes"])
-    return doc
+    """Validate item payload and build the document to store in the same pass.
+
+    Returns (None, None, doc) if valid, else (error_message, 400, None).
+    Null fields are dropped, title is stripped and integral floats become ints.
+    """
+    try:
+        (_VALIDATE_UPDATE if for_update else _VALIDATE)(data)
+    except JsonSchemaException as e:
+        return _schema_error_message(e, data), 400, None
+
+    doc = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        if key in _INT_FIELDS:
+            value = int(value)
+        elif key == "title":
+            value = value.strip()
+        doc[key] = value
+    return None, None, doc
+
+
+def _parse_item_id(item_id):
+    """Return the ObjectId for item_id, or None if it is not a valid id."""
+    if not _OID_RE.match(item_id):
+        return None
+    return ObjectId(item_id)
+
+
+def _json_body():
+    """Parse the raw request body with orjson; an empty body parses as {}."""
+    if request.content_length and request.content_length > MAX_BODY_BYTES:
+        abort(413)
+    return orjson.loads(request.get_data(cache=False) or b"{}")
 
 
 # ——— REST API ———
 
 
+@app.errorhandler(413)
+def payload_too_large(e):
+    """413 — JSON body stating the size limit."""
+    return jsonify({"error": f"Request body must not exceed {MAX_BODY_BYTES} bytes"}), 413
+
+
 @app.route("/api/items", methods=["GET"])
 def list_items():
     """GET /api/items — list all watchlist items."""
     try:
         coll = get_items_collection()
-        cursor = coll.find().sort("date_added", -1)
+        cursor = (
+            coll.find({}, projection=ITEM_PROJECTION)
+            .sort("date_added", -1)
+            .batch_size(LIST_BATCH_SIZE)
+        )
         items = [serialize_item(d) for d in cursor]
         return jsonify(items)
     except PyMongoError as e:
@@ -124,21 +222,24 @@ def list_items():
 @app.route("/api/items", methods=["POST"])
 def create_item():
     """POST /api/items — create a new watchlist item."""
-    data = request.get_json(silent=True)
-    err, status = validate_item(data or {}, for_update=False)
+    try:
+        data = _json_body()
+    except orjson.JSONDecodeError:
+        return jsonify({"error": "Invalid JSON"}), 400
+    err, status, doc = validate_item(data, for_update=False)
     if err:
         return jsonify({"error": err}), status
 
-    doc = build_item_from_body(data)
     doc.setdefault("type", "Movie")
     doc.setdefault("status", "Planned")
-    doc["date_added"] = datetime.utcnow()
+    # BSON stores milliseconds; truncate so this response matches later reads
+    now = datetime.now(TIMEZONE)
+    doc["date_added"] = now.replace(microsecond=now.microsecond // 1000 * 1000)
 
     try:
         coll = get_items_collection()
-        result = coll.insert_one(doc)
-        created = coll.find_one({"_id": result.inserted_id})
-        return jsonify(serialize_item(created)), 201
+        coll.insert_one(doc)  # sets doc["_id"]
+        return jsonify(serialize_item(doc)), 201
     except PyMongoError as e:
         return jsonify({"error": "Database error", "detail": str(e)}), 500
 
@@ -146,24 +247,28 @@ def create_item():
 @app.route("/api/items/<item_id>", methods=["PUT"])
 def update_item(item_id):
     """PUT /api/items/<id> — update an existing item."""
-    if not ObjectId.is_valid(item_id):
+    oid = _parse_item_id(item_id)
+    if oid is None:
         return jsonify({"error": "Invalid item id"}), 400
 
-    data = request.get_json(silent=True)
-    err, status = validate_item(data or {}, for_update=True)
+    try:
+        data = _json_body()
+    except orjson.JSONDecodeError:
+        return jsonify({"error": "Invalid JSON"}), 400
+    err, status, updates = validate_item(data, for_update=True)
     if err:
         return jsonify({"error": err}), status
 
-    updates = build_item_from_body(data or {})
     if not updates:
         return jsonify({"error": "No valid fields to update"}), 400
 
     try:
         coll = get_items_collection()
         result = coll.find_one_and_update(
-            {"_id": ObjectId(item_id)},
+            {"_id": oid},
             {"$set": updates},
-            return_document=True,
+            projection=ITEM_PROJECTION,
+            return_document=ReturnDocument.AFTER,
         )
         if not result:
             return jsonify({"error": "Item not found"}), 404
@@ -175,12 +280,13 @@ def update_item(item_id):
 @app.route("/api/items/<item_id>", methods=["DELETE"])
 def delete_item(item_id):
     """DELETE /api/items/<id> — delete an item."""
-    if not ObjectId.is_valid(item_id):
+    oid = _parse_item_id(item_id)
+    if oid is None:
         return jsonify({"error": "Invalid item id"}), 400
 
     try:
         coll = get_items_collection()
-        result = coll.delete_one({"_id": ObjectId(item_id)})
+        result = coll.delete_one({"_id": oid})
         if result.deleted_count == 0:
             return jsonify({"error": "Item not found"}), 404
         return jsonify({"message": "Item deleted"}), 200
@@ -188,24 +294,22 @@ def delete_item(item_id):
         return jsonify({"error": "Database error", "detail": str(e)}), 500
 
 
+@app.cli.command("init-db")
+def init_db():
+    """Create the collection indexes (run once per deploy, before serving)."""
+    ensure_indexes()
+
+
 # ——— Serve frontend ———
 
 
 @app.route("/")
 def index():
-    return send_from_directory(FRONTEND_DIR, "index.html")
-
-
-@app.route("/dashboard.html")
-def dashboard():
-    return send_from_directory(FRONTEND_DIR, "dashboard.html")
-
-
-@app.route("/<path:path>")
-def frontend_static(path):
-    """Serve frontend static files (css/, js/)."""
-    return send_from_directory(FRONTEND_DIR, path)
+    """Serve index.html; css/, js/ and other pages come from the static view."""
+    return app.send_static_file("index.html")
 
 
+# Local development only; run.sh serves the app with gunicorn + gevent
 if __name__ == "__main__":
+    ensure_indexes()
     app.run(host="0.0.0.0", port=5000, debug=False, use_reloader=False)
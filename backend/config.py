@@ -1,10 +1,18 @@
 """Configuration and MongoDB connection for Watchlist app."""
+import logging
 import os
+from datetime import UTC
+from functools import lru_cache
 from pathlib import Path
 
+from bson.codec_options import CodecOptions
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import DESCENDING, MongoClient
+from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
 
 # Load .env from project root (parent of backend/)
 _env_path = Path(__file__).resolve().parent.parent / ".env"
@@ -14,13 +22,48 @@ MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 DB_NAME = "watchlist"
 COLLECTION_NAME = "items"
 
+# Timezone for every stored datetime; dates decode tz-aware so they round-trip
+TIMEZONE = UTC
+_CODEC_OPTIONS = CodecOptions(tz_aware=True, tzinfo=TIMEZONE)
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> MongoClient:
+    """Return the process-wide MongoClient (it is already a thread-safe pool)."""
+    return MongoClient(MONGODB_URI, maxPoolSize=50, minPoolSize=5, connect=False)
+
 
 def get_db() -> Database:
     """Return MongoDB database instance."""
-    client = MongoClient(MONGODB_URI)
-    return client[DB_NAME]
+    return _get_client()[DB_NAME]
 
 
-def get_items_collection():
+@lru_cache(maxsize=1)
+def get_items_collection() -> Collection:
     """Return the items collection."""
-    return get_db()[COLLECTION_NAME]
+    return get_db().get_collection(COLLECTION_NAME, codec_options=_CODEC_OPTIONS)
+
+
+def ensure_indexes():
+    """Create the indexes the API relies on; run once at startup, never per request.
+
+    A failed build is logged rather than raised: the CRUD endpoints still
+    work without the index, just with an in-memory sort.
+    """
+    try:
+        # GET /api/items sorts newest first
+        get_items_collection().create_index(
+            [("date_added", DESCENDING)], name="date_added_desc", background=True
+        )
+    except PyMongoError:
+        logger.warning("Could not create indexes on %s", COLLECTION_NAME, exc_info=True)
+
+
+def _reset_after_fork():
+    """Drop cached handles so forked workers open their own connection pool."""
+    get_items_collection.cache_clear()
+    _get_client.cache_clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
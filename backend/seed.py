@@ -7,40 +7,45 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from config import get_items_collection
-
-SAMPLES = [
-    {
-        "title": "Inception",
-        "type": "Movie",
-        "status": "Completed",
-        "rating": 9,
-        "notes": "Mind-bending thriller.",
-        "date_added": datetime.utcnow(),
-    },
-    {
-        "title": "Breaking Bad",
-        "type": "TV Show",
-        "status": "Watching",
-        "rating": 10,
-        "current_episode": 3,
-        "total_episodes": 62,
-        "notes": "Season 1.",
-        "date_added": datetime.utcnow(),
-    },
-    {
-        "title": "The Shawshank Redemption",
-        "type": "Movie",
-        "status": "Planned",
-        "notes": "Classic to watch.",
-        "date_added": datetime.utcnow(),
-    },
-]
+from config import TIMEZONE, ensure_indexes, get_items_collection
+
+
+def build_samples(now):
+    """Return the sample items, all stamped with the same date_added."""
+    return [
+        {
+            "title": "Inception",
+            "type": "Movie",
+            "status": "Completed",
+            "rating": 9,
+            "notes": "Mind-bending thriller.",
+            "date_added": now,
+        },
+        {
+            "title": "Breaking Bad",
+            "type": "TV Show",
+            "status": "Watching",
+            "rating": 10,
+            "current_episode": 3,
+            "total_episodes": 62,
+            "notes": "Season 1.",
+            "date_added": now,
+        },
+        {
+            "title": "The Shawshank Redemption",
+            "type": "Movie",
+            "status": "Planned",
+            "notes": "Classic to watch.",
+            "date_added": now,
+        },
+    ]
 
 
 def main():
+    ensure_indexes()
     coll = get_items_collection()
-    result = coll.insert_many(SAMPLES)
+    samples = build_samples(datetime.now(TIMEZONE))
+    result = coll.insert_many(samples, ordered=False, bypass_document_validation=True)
     print(f"Inserted {len(result.inserted_ids)} sample items.")
 
 
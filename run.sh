@@ -6,7 +6,9 @@ BRANCH="${BRANCH:-main}"
 
 VENV="$APP_DIR/venv"
 PY="$VENV/bin/python"
-APP="backend/app.py"
+GUNICORN="$VENV/bin/gunicorn"
+WORKERS="${WORKERS:-$(nproc)}"
+BIND="${BIND:-0.0.0.0:5000}"
 LOG="log.txt"
 PIDFILE="app.pid"
 
@@ -43,8 +45,12 @@ if [[ -f "$PIDFILE" ]]; then
   rm -f "$PIDFILE"
 fi
 
-# --- start server (same behavior as your nohup command) ---
-nohup "$PY" "$APP" >> "$LOG" 2>&1 &
+# --- create indexes (off the request path; failures are logged, not fatal) ---
+"$VENV/bin/flask" --app backend/app.py init-db
+
+# --- start server (gevent workers so requests waiting on Mongo yield to each other) ---
+nohup "$GUNICORN" -k gevent -w "$WORKERS" --worker-connections 1000 \
+  --chdir backend -b "$BIND" app:app >> "$LOG" 2>&1 &
 echo $! > "$PIDFILE"
 
 echo "Started PID $(cat "$PIDFILE")"
@@ -0,0 +1,20 @@
+"""Tests for frontend file caching headers."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app import app
+
+
+@pytest.mark.parametrize(
+    "url", ["/", "/index.html", "/dashboard.html", "/js/dashboard.js", "/css/style.css"]
+)
+def test_frontend_files_revalidate(url):
+    resp = app.test_client().get(url)
+    resp.close()
+    assert resp.status_code == 200
+    assert "max-age" not in resp.headers.get("Cache-Control", "")
+    assert resp.headers.get("ETag")
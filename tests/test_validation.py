@@ -0,0 +1,164 @@
+"""Tests for item payload validation and request body parsing."""
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+from werkzeug.exceptions import RequestEntityTooLarge
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app import MAX_BODY_BYTES, _json_body, app, validate_item
+
+# ——— validate_item ———
+
+
+def test_valid_item_builds_doc():
+    err, status, doc = validate_item({"title": "Inception", "rating": 9})
+    assert (err, status) == (None, None)
+    assert doc == {"title": "Inception", "rating": 9}
+
+
+def test_integral_float_is_accepted_and_cast_to_int():
+    err, _, doc = validate_item({"title": "x", "rating": 5.0, "total_episodes": 3.0})
+    assert err is None
+    assert doc["rating"] == 5 and type(doc["rating"]) is int
+    assert type(doc["total_episodes"]) is int
+
+
+@pytest.mark.parametrize("rating", [True, "5", 5.5, 0, 11])
+def test_invalid_rating_is_rejected(rating):
+    err, status, doc = validate_item({"title": "x", "rating": rating})
+    assert status == 400
+    assert "rating" in err
+    assert doc is None
+
+
+def test_negative_episode_is_rejected():
+    err, status, _ = validate_item({"title": "x", "current_episode": -1})
+    assert status == 400
+    assert "current_episode" in err
+
+
+@pytest.mark.parametrize("title", ["", "   "])
+def test_blank_title_is_rejected(title):
+    err, status, _ = validate_item({"title": title})
+    assert status == 400
+    assert "title" in err
+
+
+def test_title_is_stripped():
+    _, _, doc = validate_item({"title": "  Inception  "})
+    assert doc["title"] == "Inception"
+
+
+def test_missing_title_is_rejected_on_create_only():
+    err, status, _ = validate_item({"rating": 5})
+    assert status == 400
+    assert "title" in err
+
+    err, _, doc = validate_item({"rating": 5}, for_update=True)
+    assert err is None
+    assert doc == {"rating": 5}
+
+
+def test_unknown_key_is_rejected():
+    err, status, _ = validate_item({"title": "x", "genre": "Drama"})
+    assert status == 400
+    assert "genre" in err
+
+
+def test_invalid_enum_is_rejected():
+    err, status, _ = validate_item({"title": "x", "type": "Book"})
+    assert status == 400
+    assert "type" in err
+
+
+def test_null_optional_fields_are_dropped():
+    err, _, doc = validate_item(
+        {"title": "x", "notes": None, "rating": None, "type": None, "status": None}
+    )
+    assert err is None
+    assert doc == {"title": "x"}
+
+
+def test_non_object_body_is_rejected():
+    err, status, _ = validate_item(["title"])
+    assert status == 400
+    assert err
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({"title": "x", "current_episode": -1}, "current_episode must be non-negative"),
+        ({"title": "  "}, "title is required and cannot be empty"),
+        ({"title": "x", "type": "Book"}, "type must be one of: Movie, TV Show"),
+        ({"title": "x", "genre": "Drama"}, "Unknown field: genre"),
+        ({"rating": 5}, "Missing required field: title"),
+        ({"title": "x", "rating": 11}, "rating must be between 1 and 10"),
+    ],
+)
+def test_error_messages_are_field_level(data, message):
+    err, _, _ = validate_item(data)
+    assert err == message
+
+
+# ——— _json_body ———
+
+
+def test_empty_body_parses_as_empty_object():
+    with app.test_request_context("/api/items", method="POST", data=b""):
+        assert _json_body() == {}
+
+
+def test_body_is_parsed():
+    body = orjson.dumps({"title": "x"})
+    with app.test_request_context("/api/items", method="POST", data=body):
+        assert _json_body() == {"title": "x"}
+
+
+def test_invalid_json_raises():
+    with (
+        app.test_request_context("/api/items", method="POST", data=b"{not json"),
+        pytest.raises(orjson.JSONDecodeError),
+    ):
+        _json_body()
+
+
+def test_oversized_body_is_rejected_before_parsing():
+    body = b"x" * (MAX_BODY_BYTES + 1)
+    with (
+        app.test_request_context("/api/items", method="POST", data=body),
+        pytest.raises(RequestEntityTooLarge),
+    ):
+        _json_body()
+
+
+# ——— error responses ———
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_invalid_json_returns_400(client):
+    resp = client.post(
+        "/api/items", data=b"{not json", content_type="application/json"
+    )
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "Invalid JSON"}
+
+
+def test_oversized_body_returns_json_413(client):
+    body = b"x" * (MAX_BODY_BYTES + 1)
+    resp = client.post("/api/items", data=body, content_type="application/json")
+    assert resp.status_code == 413
+    assert str(MAX_BODY_BYTES) in resp.get_json()["error"]
+
+
+def test_validation_error_returns_400(client):
+    resp = client.post("/api/items", json={"title": "x", "rating": "5"})
+    assert resp.status_code == 400
+    assert "rating" in resp.get_json()["error"]